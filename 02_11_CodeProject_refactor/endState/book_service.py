@@ -8,8 +8,11 @@ listing books with optional search and sorting, and deleting books.
 
 Methods:
     create_book(title, author): Create a new book with auto-generated ID
+    create_books(items): Create several books at once from (title, author) pairs
     get_book(book_id): Retrieve a book by its unique ID
     list_books(search=None, sort_by=None, ascending=True): List books with optional filtering and sorting
+    iter_books(search=None): Iterate over books without building a full list
+    search_books(terms): List books matching any of several search terms
     delete_book(book_id): Remove a book from the collection
 
 Usage Example:
@@ -33,20 +36,168 @@ Usage Example:
     service.delete_book(book2["id"])
 """
 
+import sys
+from bisect import bisect_left, insort
+from collections import OrderedDict, defaultdict
+from collections.abc import Iterable, Iterator, Sequence
+from operator import itemgetter
+
+
+_VALID_SORT_FIELDS = frozenset(("id", "title", "author"))
+# Number of distinct recent searches whose results list_books keeps
+_QUERY_CACHE_SIZE = 128
+# Joins a book's casefolded title and author into one search text
+_FIELD_SEPARATOR = "\x00"
+
+
+def _trigrams(text: str) -> set[str]:
+    """Return every 3-character slice of text, spaces and punctuation included.
+    
+    Any substring of a book's title or author has only grams that also
+    occur in that field, so a book can only match a search term if it
+    holds all of the term's grams. Text shorter than three characters has
+    no grams.
+    """
+    return {text[i:i + 3] for i in range(len(text) - 2)}
 
 
 class BookService:
     """In-memory book service with CRUD operations."""
     
     def __init__(self) -> None:
-        """Initialize BookService with empty book list and ID counter.
-        
-        Initializes a new BookService instance with an empty list of books
-        and sets the next available ID to 1.
+        """Initialize BookService with empty book store and ID counter.
+        
+        Initializes a new BookService instance with an empty store of books
+        keyed by ID, empty columns of numeric IDs, of casefolded titles and
+        authors used by sorting, and of the joined casefolded text used by
+        search, and sets the next available ID to 1.
+        
+        The store is an insertion-ordered dict, so removing a book from it
+        is a single hashed removal that keeps the remaining books in
+        creation order. The columns are keyed by book ID and updated
+        together with the store, so iterating their values walks the books
+        in the same order. The trigram index maps each 3-character slice of
+        a casefolded title or author to the IDs of the books containing it,
+        letting searches skip books that cannot match.
+        
+        Every book is also kept in title and author order, as sorted lists
+        of (casefolded key, numeric ID, book) entries updated with bisect on
+        each change. This trades write speed for reads: inserting into or
+        removing from those lists shifts their tail, so create_book and
+        delete_book are O(n) in the catalog size. A tuple snapshot of all
+        books, and one per requested sort order, is cached between changes
+        so repeated unfiltered listings only copy a tuple; results of recent
+        searches are kept in a small LRU cache on the same terms.
         """
-        self.books: list[dict[str, str]] = []
+        self._books: dict[str, dict[str, str]] = {}
+        self._id_numbers: dict[str, int] = {}
+        self._titles_folded: dict[str, str] = {}
+        self._authors_folded: dict[str, str] = {}
+        self._search_texts: dict[str, str] = {}
+        # Sort field name -> column of casefolded sort keys
+        self._sort_columns: dict[str, dict[str, str]] = {
+            "title": self._titles_folded,
+            "author": self._authors_folded,
+        }
+        self._trigram_index: defaultdict[str, set[str]] = defaultdict(set)
+        self._sort_orders: dict[str, list[tuple[str, int, dict[str, str]]]] = {
+            "title": [],
+            "author": [],
+        }
+        self._snapshot_cache: tuple[dict[str, str], ...] | None = None
+        self._sorted_cache: dict[tuple[str, bool], tuple[dict[str, str], ...]] = {}
+        self._query_cache: OrderedDict[
+            tuple[str, str | None, bool], tuple[dict[str, str], ...]
+        ] = OrderedDict()
         self._next_id: int = 1
     
+    @property
+    def books(self) -> list[dict[str, str]]:
+        """All books in creation order, as a new list."""
+        return list(self._snapshot())
+    
+    def _snapshot(self) -> tuple[dict[str, str], ...]:
+        """Return all books in creation order as a cached tuple.
+        
+        The tuple is rebuilt only after a book has been created or deleted
+        since the last call, so repeated listings of an unchanged catalog
+        just copy it into a new list.
+        
+        Returns:
+            An immutable tuple of all books, in creation order
+        """
+        if self._snapshot_cache is None:
+            self._snapshot_cache = tuple(self._books.values())
+        return self._snapshot_cache
+    
+    def _sorted_snapshot(self, sort_by: str,
+                         ascending: bool) -> tuple[dict[str, str], ...]:
+        """Return all books in the given sort order as a cached tuple.
+        
+        Each (sort_by, ascending) order is built at most once between
+        changes to the catalog. Titles and authors are read from the sort
+        orders maintained on every change, so no full sort is needed.
+        Descending orders are re-sorted from the ascending list rather than
+        reversed, so books with equal keys keep creation order in both
+        directions; on already sorted input that re-sort is close to linear.
+        
+        Args:
+            sort_by: Field name to sort by, already validated by list_books
+            ascending: Sort direction - True for ascending, False for descending
+        
+        Returns:
+            An immutable tuple of all books in the requested order
+        """
+        key = (sort_by, ascending)
+        cached = self._sorted_cache.get(key)
+        if cached is None:
+            if sort_by == "id":
+                cached = tuple(self._sort_books(self._snapshot(), sort_by, ascending))
+            else:
+                order = self._sort_orders[sort_by]
+                if not ascending:
+                    order = sorted(order, key=itemgetter(0), reverse=True)
+                cached = tuple(map(itemgetter(2), order))
+            self._sorted_cache[key] = cached
+        return cached
+    
+    def _search_results(self, search_folded: str, sort_by: str | None,
+                        ascending: bool) -> tuple[dict[str, str], ...]:
+        """Return the books matching a search, in order, from an LRU cache.
+        
+        Results are cached per (search term, sort_by, ascending) for the
+        _QUERY_CACHE_SIZE most recently used queries and dropped whenever
+        a book is created or deleted.
+        
+        Args:
+            search_folded: The casefolded search term
+            sort_by: Field name to sort by, already validated by list_books,
+                or None to keep creation order
+            ascending: Sort direction - True for ascending, False for descending
+        
+        Returns:
+            An immutable tuple of the matching books in the requested order
+        """
+        key = (search_folded, sort_by, ascending)
+        cached = self._query_cache.get(key)
+        if cached is not None:
+            self._query_cache.move_to_end(key)
+            return cached
+        
+        result: Sequence[dict[str, str]] = self._search_books(search_folded)
+        if sort_by is not None:
+            result = self._sort_books(result, sort_by, ascending)
+        cached = self._query_cache[key] = tuple(result)
+        if len(self._query_cache) > _QUERY_CACHE_SIZE:
+            self._query_cache.popitem(last=False)
+        return cached
+    
+    def _invalidate_caches(self) -> None:
+        """Drop the cached snapshots and query results after a change."""
+        self._snapshot_cache = None
+        self._sorted_cache.clear()
+        self._query_cache.clear()
+    
     def create_book(self, title: str, author: str) -> dict[str, str]:
         """Create a new book and return it with generated ID.
         
@@ -81,27 +232,108 @@ class BookService:
         title = title.strip()
         author = author.strip()
         
-        if not title or not author:
+        if not (title and author):
+            raise ValueError("Title and author must be non-empty strings")
+        
+        return self._add_book(title, author)
+    
+    def create_books(self, items: Iterable[tuple[str, str]]) -> list[dict[str, str]]:
+        """Create several books at once and return them with generated IDs.
+        
+        Bulk-loading counterpart of create_book. Every pair is stripped and
+        validated before any book is added, so either all books are created
+        or none are. IDs are assigned consecutively in input order.
+        
+        Args:
+            items: An iterable of (title, author) pairs. Each title and author
+                must be a non-empty string after whitespace is stripped.
+        
+        Returns:
+            A list of the created book dictionaries, in input order.
+        
+        Raises:
+            ValueError: If any title or author is empty or contains only
+                whitespace after stripping. No books are created in that case.
+        
+        Example:
+            >>> service = BookService()
+            >>> books = service.create_books([("1984", "George Orwell"),
+            ...                               ("Animal Farm", "George Orwell")])
+            >>> [book['id'] for book in books]
+            ['1', '2']
+        """
+        # Strip and validate everything up front so a bad pair adds nothing
+        pairs = [(title.strip(), author.strip()) for title, author in items]
+        
+        if not all(title and author for title, author in pairs):
             raise ValueError("Title and author must be non-empty strings")
         
-        # Create book dict
+        # Append to the sort orders unsorted, then restore their order with
+        # one stable sort each instead of a bisect insert (and list shift)
+        # per book
+        add_book = self._add_book
+        books = [add_book(title, author, keep_sorted=False) for title, author in pairs]
+        for order in self._sort_orders.values():
+            order.sort(key=itemgetter(0))
+        return books
+    
+    def _add_book(self, title: str, author: str,
+                  keep_sorted: bool = True) -> dict[str, str]:
+        """Store an already stripped and validated book under the next ID.
+        
+        Helper method shared by create_book and create_books. Updates the
+        book store, the search columns, the trigram index and the sort
+        orders.
+        
+        Args:
+            title: The stripped, non-empty title
+            author: The stripped, non-empty author
+            keep_sorted: Whether to bisect the book into the sort orders.
+                If False, its entries are appended and the caller must
+                re-sort the orders (stably, on the key) before they are read.
+        
+        Returns:
+            The new book dictionary
+        """
+        # Authors repeat across books, so intern them (and their folded
+        # form) to share one string object per author instead of one per book
+        author = sys.intern(author)
+        
+        # Create book dict; the ID is only formatted as a string here, at
+        # the API boundary, and kept as an int internally
+        id_number = self._next_id
+        book_id = str(id_number)
         book = {
-            "id": str(self._next_id),
+            "id": book_id,
             "title": title,
             "author": author
         }
         
-        # Add to list and increment counter
-        self.books.append(book)
+        # Add to store, search columns, trigram index and sort orders, then
+        # increment counter
+        title_folded = title.casefold()
+        author_folded = sys.intern(author.casefold())
+        self._books[book_id] = book
+        self._id_numbers[book_id] = id_number
+        self._titles_folded[book_id] = title_folded
+        self._authors_folded[book_id] = author_folded
+        self._search_texts[book_id] = title_folded + _FIELD_SEPARATOR + author_folded
+        for gram in _trigrams(title_folded) | _trigrams(author_folded):
+            self._trigram_index[gram].add(book_id)
+        # The new ID is the largest, so it lands after any equal keys
+        add_entry = insort if keep_sorted else list.append
+        add_entry(self._sort_orders["title"], (title_folded, id_number, book))
+        add_entry(self._sort_orders["author"], (author_folded, id_number, book))
         self._next_id += 1
+        self._invalidate_caches()
         
         return book
     
     def get_book(self, book_id: str) -> dict[str, str] | None:
         """Retrieve a book by its unique identifier.
         
-        Searches the book collection for a book with the specified ID and
-        returns its data if found.
+        Looks the ID up in the service's book store and returns the book data
+        if found. Non-string IDs never match a book.
         
         Args:
             book_id: The unique string identifier of the book to retrieve.
@@ -120,10 +352,9 @@ class BookService:
             >>> service.get_book('999')
             None
         """
-        for book in self.books:
-            if book["id"] == book_id:
-                return book
-        return None
+        if not isinstance(book_id, str):
+            return None
+        return self._books.get(book_id)
     
     def list_books(self, search: str | None = None, 
                    sort_by: str | None = None, 
@@ -135,7 +366,8 @@ class BookService:
         
         Args:
             search: Optional search term to filter books by. Searches both
-                title and author fields (case-insensitive). If None, no
+                title and author fields (case-insensitive, using Unicode
+                case folding so e.g. 'STRASSE' matches 'Straße'). If None, no
                 filtering is applied.
             sort_by: Optional field name to sort by. Valid values are 'title',
                 'author', or 'id'. If None, no sorting is applied.
@@ -148,8 +380,9 @@ class BookService:
             based on the provided parameters.
         
         Raises:
-            ValueError: If sort_by is specified but not one of the valid
-                field names ('title', 'author', 'id').
+            ValueError: If sort_by is not None and not one of the valid
+                field names ('title', 'author', 'id'), including the empty
+                string.
         
         Example:
             >>> service = BookService()
@@ -163,61 +396,194 @@ class BookService:
             >>> # Sort by title
             >>> sorted_books = service.list_books(sort_by="title")
         """
-        # Start with all books
-        result = self.books.copy()
+        # Validate sort_by before doing any copying or filtering; any value
+        # other than None must name a field (so "" is rejected, not ignored)
+        if sort_by is not None and sort_by not in _VALID_SORT_FIELDS:
+            raise ValueError(f"Invalid sort field: {sort_by}. "
+                             f"Must be one of {sorted(_VALID_SORT_FIELDS)}")
+        
+        # Nothing to filter or sort in an empty catalog
+        if not self._books:
+            return []
+        
+        # Filter by search if provided, reusing the result of an identical
+        # recent query when the catalog has not changed since
+        if search:
+            return list(self._search_results(search.casefold(), sort_by, ascending))
+        
+        # Otherwise copy the snapshot cached since the last change, in the
+        # requested order
+        if sort_by is not None:
+            return list(self._sorted_snapshot(sort_by, ascending))
+        return list(self._snapshot())
+    
+    def iter_books(self, search: str | None = None) -> Iterator[dict[str, str]]:
+        """Iterate over books in creation order, optionally filtered.
+        
+        A lighter alternative to list_books for callers that only loop over
+        the results once: no list of the whole catalog is built. Without a
+        search term this walks the cached snapshot of all books, so creating
+        or deleting books while iterating does not affect the iteration.
         
-        # Filter by search if provided
+        Args:
+            search: Optional search term, matched exactly like the search
+                argument of list_books. If None or empty, every book is
+                yielded.
+        
+        Yields:
+            Book dictionaries with keys 'id', 'title', and 'author', in
+            creation order.
+        
+        Example:
+            >>> service = BookService()
+            >>> service.create_book("1984", "George Orwell")
+            >>> for book in service.iter_books(search="orwell"):
+            ...     print(book['title'])
+            1984
+        """
         if search:
-            search_lower = search.lower()
-            result = [
-                book for book in result 
-                if search_lower in book["title"].lower() or 
-                   search_lower in book["author"].lower()
+            yield from self._search_books(search.casefold())
+        else:
+            yield from self._snapshot()
+    
+    def search_books(self, terms: Iterable[str]) -> list[dict[str, str]]:
+        """List books matching any of several search terms.
+        
+        Each term is matched like the search argument of list_books, and a
+        book is included once if at least one term matches. Every distinct
+        term is looked up through the trigram index separately, so the cost
+        grows with the number of candidate books rather than with the number
+        of terms times the catalog size.
+        
+        Args:
+            terms: The search terms. An empty term matches every book, as
+                an empty search does in list_books. A single string is
+                treated as one term, not as a sequence of characters.
+        
+        Returns:
+            A new list of the matching books, in creation order. Empty if
+            no terms are given.
+        
+        Example:
+            >>> service = BookService()
+            >>> service.create_book("1984", "George Orwell")
+            >>> service.create_book("Emma", "Jane Austen")
+            >>> service.create_book("Dune", "Frank Herbert")
+            >>> [b['title'] for b in service.search_books(["orwell", "austen"])]
+            ['1984', 'Emma']
+        """
+        if isinstance(terms, str):
+            terms = (terms,)
+        terms_folded = {term.casefold() for term in terms}
+        if "" in terms_folded:
+            return list(self._snapshot())
+        
+        matched_ids: set[str] = set()
+        for term_folded in terms_folded:
+            matched_ids.update(map(itemgetter("id"), self._search_books(term_folded)))
+        
+        # IDs are increasing integers, so numeric order is creation order
+        ordered = sorted(matched_ids, key=self._id_numbers.__getitem__)
+        return [self._books[book_id] for book_id in ordered]
+    
+    def _search_books(self, search_folded: str) -> list[dict[str, str]]:
+        """Find books whose title or author contains a casefolded term.
+        
+        Helper method for list_books, iter_books and search_books. For terms
+        of three or more characters, the trigram index narrows the scan to
+        books containing all of the term's grams (including those spanning
+        spaces, such as "k 5"); each candidate is then checked with a real
+        substring test. Shorter terms fall back to scanning every book.
+        
+        Substring tests run once per book against the joined search text
+        (title, separator, author) rather than once per field. A term that
+        itself contains the separator could match across the join, so it is
+        tested against each field separately instead.
+        
+        Args:
+            search_folded: The casefolded search term
+        
+        Returns:
+            A new list of matching books, in creation order
+        """
+        texts = self._search_texts
+        
+        if _FIELD_SEPARATOR in search_folded:
+            return [
+                book for book, title_folded, author_folded
+                in zip(self._books.values(), self._titles_folded.values(),
+                       self._authors_folded.values())
+                if search_folded in title_folded or search_folded in author_folded
             ]
         
-        # Sort if sort_by is provided
-        if sort_by:
-            result = self._sort_books(result, sort_by, ascending)
+        grams = _trigrams(search_folded)
+        if not grams:
+            # The columns stay str rather than UTF-8 bytes: str.__contains__
+            # already runs a memchr-backed search on compact ASCII strings
+            # and measured several times faster than bytes.__contains__ here.
+            return [
+                book for book, text in zip(self._books.values(), texts.values())
+                if search_folded in text
+            ]
         
-        return result
+        # Intersect posting sets smallest first; a missing gram means no match
+        postings = sorted((self._trigram_index.get(gram, set()) for gram in grams),
+                          key=len)
+        if not postings[0]:
+            return []
+        candidates = postings[0].intersection(*postings[1:])
+        
+        # IDs are increasing integers, so numeric order is creation order
+        ordered = sorted(candidates, key=self._id_numbers.__getitem__)
+        return [
+            self._books[book_id] for book_id in ordered
+            if search_folded in texts[book_id]
+        ]
     
-    def _sort_books(self, books: list[dict[str, str]], 
-                   sort_by: str, ascending: bool = True) -> list[dict[str, str]]:
+    def _sort_books(self, books: Sequence[dict[str, str]], 
+                   sort_by: str, ascending: bool = True) -> Sequence[dict[str, str]]:
         """Sort books by the specified field.
         
         Helper method to sort a list of books by a given field with optional
-        sort direction. Handles both string and numeric sorting appropriately.
+        sort direction.
+        
+        IDs are assigned in increasing order and books are kept in creation
+        order, so sorting by 'id' only needs the input order (or its reverse).
+        Titles and authors are sorted on the casefolded columns computed at
+        creation time, with C-level key functions instead of a Python
+        callback per book.
         
         Args:
-            books: List of book dictionaries to sort
-            sort_by: Field name to sort by ('id', 'title', or 'author')
+            books: Sequence of book dictionaries to sort, in creation order;
+                it is not modified
+            sort_by: Field name to sort by ('id', 'title', or 'author'),
+                already validated by list_books
             ascending: Sort direction - True for ascending, False for descending
         
         Returns:
-            A new list of books sorted by the specified field
-        
-        Raises:
-            ValueError: If sort_by is not one of the valid field names
+            The books sorted by the specified field. Callers freeze the result
+            into a cached tuple, so no defensive copy is made: for ascending
+            'id' this is the input itself, otherwise a new sequence.
         """
-        valid_fields = {"id", "title", "author"}
-        if sort_by not in valid_fields:
-            raise ValueError(f"Invalid sort field: {sort_by}. Must be one of {valid_fields}")
-        
-        def sort_key(book):
-            value = book[sort_by]
-            if sort_by == "id":
-                return int(value)  # Sort IDs numerically
-            return value.lower()  # Case-insensitive for strings
-        
-        sorted_books = books.copy()
-        sorted_books.sort(key=sort_key, reverse=not ascending)
-        return sorted_books
+        if sort_by == "id":
+            return books if ascending else books[::-1]
+        
+        # Pair each book with its precomputed casefolded key, sort the pairs
+        # on the key alone (stable, so ties keep creation order) and unpack.
+        # Keeping the keys plain str lets list.sort use its specialized
+        # string comparison; composite keys such as (prefix int, str)
+        # tuples lose that fast path and measured slower.
+        column = self._sort_columns[sort_by]
+        keys = map(column.__getitem__, map(itemgetter("id"), books))
+        pairs = sorted(zip(keys, books), key=itemgetter(0), reverse=not ascending)
+        return tuple(map(itemgetter(1), pairs))
     
     def delete_book(self, book_id: str) -> bool:
         """Delete a book from the collection by its unique identifier.
         
         Removes the book with the specified ID from the service's collection.
-        The book is permanently removed and cannot be recovered.
+        The book is permanently removed and cannot be recovered. Non-string
+        IDs never match a book and are rejected before touching the store.
         
         Args:
             book_id: The unique string identifier of the book to delete.
@@ -237,11 +603,25 @@ class BookService:
             >>> service.get_book('1')
             None
         """
-        for i, book in enumerate(self.books):
-            if book["id"] == book_id:
-                self.books.pop(i)
-                return True
-        return False
+        if not isinstance(book_id, str):
+            return False
+        book = self._books.pop(book_id, None)
+        if book is None:
+            return False
+        self._invalidate_caches()
+        id_number = self._id_numbers.pop(book_id)
+        title_folded = self._titles_folded.pop(book_id)
+        author_folded = self._authors_folded.pop(book_id)
+        del self._search_texts[book_id]
+        for field, key in (("title", title_folded), ("author", author_folded)):
+            order = self._sort_orders[field]
+            del order[bisect_left(order, (key, id_number))]
+        for gram in _trigrams(title_folded) | _trigrams(author_folded):
+            posting = self._trigram_index[gram]
+            posting.discard(book_id)
+            if not posting:
+                del self._trigram_index[gram]
+        return True
 
 
 def demo() -> None:
@@ -1,5 +1,5 @@
 import pytest
-from book_service import BookService
+from book_service import _QUERY_CACHE_SIZE, BookService
 
 
 class TestBookServiceCreate:
@@ -70,6 +70,41 @@ class TestBookServiceCreate:
         assert book1["id"] == "1"
         assert book2["id"] == "2"
         assert len(service.books) == 2
+    
+    def test_create_books_batch(self):
+        """Test creating several books at once."""
+        service = BookService()
+        service.create_book("First", "Author")
+        books = service.create_books([("  Second ", "Author"), ("Third", " Other ")])
+        
+        assert [book["id"] for book in books] == ["2", "3"]
+        assert books[0]["title"] == "Second"
+        assert books[1]["author"] == "Other"
+        assert service.get_book("3") == books[1]
+        assert len(service.list_books(search="other")) == 1
+    
+    def test_create_books_sorted_listings(self):
+        """Test that unsorted batches are listed in order, also after a deletion."""
+        service = BookService()
+        service.create_book("D", "w")
+        books = service.create_books([("C", "x"), ("A", "z"), ("B", "y")])
+        
+        assert [b["title"] for b in service.list_books(sort_by="title")] == ["A", "B", "C", "D"]
+        assert [b["author"] for b in service.list_books(sort_by="author")] == ["w", "x", "y", "z"]
+        
+        service.delete_book(books[0]["id"])
+        
+        assert [b["title"] for b in service.list_books(sort_by="title")] == ["A", "B", "D"]
+        assert [b["author"] for b in service.list_books(sort_by="author")] == ["w", "y", "z"]
+    
+    def test_create_books_invalid_creates_nothing(self):
+        """Test that one invalid pair prevents the whole batch."""
+        service = BookService()
+        with pytest.raises(ValueError, match="Title and author must be non-empty strings"):
+            service.create_books([("Good", "Author"), ("   ", "Author")])
+        
+        assert service.books == []
+        assert service.create_book("Next", "Author")["id"] == "1"
 
 
 class TestBookServiceGet:
@@ -102,6 +137,18 @@ class TestBookServiceGet:
         
         assert result is None
     
+    def test_get_after_deleting_other_books(self):
+        """Test that lookups still find the remaining books after deletions."""
+        service = BookService()
+        books = [service.create_book(f"Book {i}", f"Author {i}") for i in range(10)]
+        for book in books[::2]:
+            service.delete_book(book["id"])
+        
+        for book in books[1::2]:
+            assert service.get_book(book["id"]) is book
+        for book in books[::2]:
+            assert service.get_book(book["id"]) is None
+    
     def test_get_after_deletion(self):
         """Test getting a book after it's been deleted."""
         service = BookService()
@@ -160,6 +207,85 @@ class TestBookServiceList:
         assert len(books) == 1
         assert books[0]["title"] == "Café"
     
+    def test_list_search_casefold(self):
+        """Test that search uses full Unicode case folding."""
+        service = BookService()
+        service.create_book("Die Straße", "Autor")
+        books = service.list_books(search="STRASSE")
+        
+        assert len(books) == 1
+        assert books[0]["title"] == "Die Straße"
+    
+    @pytest.mark.parametrize("search_term,expected_titles", [
+        ("gatsby", ["The Great Gatsby"]),
+        ("reat gat", ["The Great Gatsby"]),
+        ("he", ["The Great Gatsby", "The Hobbit"]),
+        ("hob", ["The Hobbit"]),
+        ("tolk", ["The Hobbit"]),
+        ("gatsby hobbit", []),
+    ])
+    def test_list_search_substrings(self, search_term, expected_titles):
+        """Test that search matches substrings within and across words."""
+        service = BookService()
+        service.create_book("The Great Gatsby", "F. Scott Fitzgerald")
+        service.create_book("The Hobbit", "J.R.R. Tolkien")
+        books = service.list_books(search=search_term)
+        
+        assert [book["title"] for book in books] == expected_titles
+    
+    def test_list_search_repeated_after_changes(self):
+        """Test that repeating a search reflects books created or deleted since."""
+        service = BookService()
+        book1 = service.create_book("Gatsby One", "Author")
+        assert service.list_books(search="gatsby") == [book1]
+        
+        book2 = service.create_book("Gatsby Two", "Author")
+        assert service.list_books(search="gatsby") == [book1, book2]
+        
+        service.delete_book(book1["id"])
+        assert service.list_books(search="gatsby") == [book2]
+    
+    def test_list_search_result_is_a_copy(self):
+        """Test that mutating a search result does not affect later searches."""
+        service = BookService()
+        service.create_book("Gatsby", "Author")
+        service.list_books(search="gatsby").clear()
+        
+        assert len(service.list_books(search="gatsby")) == 1
+    
+    def test_list_search_cache_evicts_oldest(self):
+        """Test that the search cache stays bounded and drops the oldest query."""
+        service = BookService()
+        service.create_book("Gatsby", "Author")
+        for i in range(_QUERY_CACHE_SIZE + 1):
+            service.list_books(search=f"term {i}")
+        
+        cached_terms = [search for search, _, _ in service._query_cache]
+        assert len(cached_terms) == _QUERY_CACHE_SIZE
+        assert "term 0" not in cached_terms
+        assert cached_terms[-1] == f"term {_QUERY_CACHE_SIZE}"
+    
+    def test_list_search_does_not_span_title_and_author(self):
+        """Test that a match must lie within the title or within the author."""
+        service = BookService()
+        service.create_book("Book", "Author")
+        
+        assert service.list_books(search="bookauthor") == []
+        assert service.list_books(search="k\x00a") == []
+        # Terms too short for the trigram index scan the search texts
+        assert service.list_books(search="k\x00") == []
+        assert service.list_books(search="\x00") == []
+    
+    def test_list_search_after_deletion(self):
+        """Test that deleted books no longer match searches."""
+        service = BookService()
+        book1 = service.create_book("Gatsby One", "Author")
+        book2 = service.create_book("Gatsby Two", "Author")
+        service.delete_book(book1["id"])
+        books = service.list_books(search="gatsby")
+        
+        assert books == [book2]
+    
     @pytest.mark.parametrize("sort_by,ascending,expected_order", [
         ("id", True, ["1", "2", "3"]),
         ("id", False, ["3", "2", "1"]),
@@ -180,6 +306,21 @@ class TestBookServiceList:
         
         assert actual_order == expected_order
     
+    def test_list_sorting_after_changes(self):
+        """Test that sorted listings reflect books created and deleted later."""
+        service = BookService()
+        service.create_book("B Book", "Author B")
+        book_c = service.create_book("C Book", "Author C")
+        assert [b["title"] for b in service.list_books(sort_by="title")] == ["B Book", "C Book"]
+        
+        service.create_book("A Book", "Author A")
+        service.delete_book(book_c["id"])
+        
+        titles = [b["title"] for b in service.list_books(sort_by="title")]
+        authors = [b["author"] for b in service.list_books(sort_by="author", ascending=False)]
+        assert titles == ["A Book", "B Book"]
+        assert authors == ["Author B", "Author A"]
+    
     def test_list_sort_stability(self):
         """Test that sorting is stable for identical values."""
         service = BookService()
@@ -190,6 +331,10 @@ class TestBookServiceList:
         # Should maintain original order for identical titles
         assert books[0]["author"] == "Author A"
         assert books[1]["author"] == "Author B"
+        
+        # Descending order keeps creation order for identical titles too
+        books = service.list_books(sort_by="title", ascending=False)
+        assert [book["id"] for book in books] == [book1["id"], book2["id"]]
     
     @pytest.mark.parametrize("sort_by", [
         "invalid_field",
@@ -218,6 +363,47 @@ class TestBookServiceList:
         titles = [book["title"] for book in books]
         
         assert titles == ["Book C", "Book B", "Book A"]
+    
+    def test_iter_books(self):
+        """Test iterating over books with and without a search term."""
+        service = BookService()
+        book1 = service.create_book("Book A", "Author A")
+        book2 = service.create_book("Book B", "Author B")
+        
+        assert list(service.iter_books()) == [book1, book2]
+        assert list(service.iter_books(search="author b")) == [book2]
+        assert list(service.iter_books(search="")) == [book1, book2]
+    
+    def test_iter_books_while_deleting(self):
+        """Test that deleting during iteration does not break the iterator."""
+        service = BookService()
+        for i in range(3):
+            service.create_book(f"Book {i}", f"Author {i}")
+        
+        seen = [book["id"] for book in service.iter_books()
+                if service.delete_book(book["id"])]
+        
+        assert seen == ["1", "2", "3"]
+        assert service.books == []
+    
+    @pytest.mark.parametrize("terms,expected_titles", [
+        (["orwell", "austen"], ["1984", "Emma", "Animal Farm"]),
+        (["AUSTEN", "emma"], ["Emma"]),
+        (["farm", "nonexistent"], ["Animal Farm"]),
+        (["nonexistent"], []),
+        ([], []),
+        (["", "nonexistent"], ["1984", "Emma", "Animal Farm"]),
+        ("orwell", ["1984", "Animal Farm"]),
+    ])
+    def test_search_books_any_term(self, terms, expected_titles):
+        """Test searching for books matching any of several terms."""
+        service = BookService()
+        service.create_book("1984", "George Orwell")
+        service.create_book("Emma", "Jane Austen")
+        service.create_book("Animal Farm", "George Orwell")
+        books = service.search_books(terms)
+        
+        assert [book["title"] for book in books] == expected_titles
 
 
 class TestBookServiceDelete: